@@ -1,13 +1,24 @@
-from argparse import Namespace, ArgumentParser
-from typing import Callable, Union, List, Mapping
+from functools import lru_cache
+from sys import argv
+from types import MappingProxyType, SimpleNamespace
+from typing import Callable, Union, List, Mapping, Optional, Sequence, Tuple, TYPE_CHECKING
 
-from modules.verification import is_pascal_case, directory_exists, domain_is_valid
+from modules.verification import is_pascal_case, domain_is_valid
 
 ConfigurationType = Union[str, int, List]
 ConfigurationAccessorType = Callable[[str], ConfigurationType]
 
+DEFAULT_DOMAIN: str = 'application.local'
+PACKAGES: Tuple[str, ...] = ('breeze', 'breeze.inertia', 'horizon', 'telescope')
+
+if TYPE_CHECKING:
+    from argparse import ArgumentParser, Namespace
+
+
+@lru_cache(maxsize=1)
+def create_argument_parser() -> 'ArgumentParser':
+    from argparse import ArgumentParser
 
-def create_argument_parser() -> ArgumentParser:
     main_parser: ArgumentParser = ArgumentParser(
         prog='laravel',
         description='A script to scaffold laravel projects.',
@@ -32,27 +43,73 @@ def create_argument_parser() -> ArgumentParser:
     )
     setup_subparser.add_argument(
         '--domain',
-        default='application.local',
+        default=DEFAULT_DOMAIN,
         help='The domain name where the project will be hosted.'
     )
     setup_subparser.add_argument(
         '--with',
         nargs='*',
-        choices=('breeze', 'breeze.inertia', 'horizon', 'telescope'),
+        choices=PACKAGES,
         help='Additional packages to install.'
     )
 
     return main_parser
 
 
-def validated_script_arguments(script_arguments: Namespace) -> Mapping[str, Union[str, List]]:
+def parse_script_arguments(arguments: Optional[Sequence[str]] = None) -> Union[SimpleNamespace, 'Namespace']:
+    """
+    Parses the script's arguments without building the argument parser when they follow the expected grammar:
+    setup <project_name> [--domain DOMAIN] [--with [PACKAGE ...]]
+
+    Anything else (help requests, unknown options, invalid choices...) is handed over to the argument parser so that
+    its usage and error messages are preserved.
+
+    Args:
+        arguments: The arguments to parse. Defaults to the script's arguments.
+
+    Returns:
+        A namespace holding the same attributes as the one produced by the argument parser.
+    """
+    arguments = list(argv[1:] if arguments is None else arguments)
+
+    if len(arguments) < 2 or arguments[0] != 'setup' or arguments[1].startswith('-'):
+        return create_argument_parser().parse_args(arguments)
+
+    parsed: SimpleNamespace = SimpleNamespace(
+        action='setup', project_name=arguments[1], domain=DEFAULT_DOMAIN, **{'with': None})
+    index: int = 2
+
+    while index < len(arguments):
+        argument: str = arguments[index]
+
+        if argument.startswith('--domain='):
+            parsed.domain = argument[len('--domain='):]
+            index += 1
+        elif argument == '--domain' and index + 1 < len(arguments) and not arguments[index + 1].startswith('-'):
+            parsed.domain = arguments[index + 1]
+            index += 2
+        elif argument == '--with':
+            packages: List[str] = []
+            index += 1
+
+            while index < len(arguments) and not arguments[index].startswith('-'):
+                if arguments[index] not in PACKAGES:
+                    return create_argument_parser().parse_args(arguments)
+
+                packages.append(arguments[index])
+                index += 1
+
+            parsed.__setattr__('with', packages)
+        else:
+            return create_argument_parser().parse_args(arguments)
+
+    return parsed
+
+
+def validated_script_arguments(script_arguments: 'Namespace') -> Mapping[str, Union[str, List]]:
     if not is_pascal_case(script_arguments.project_name):
         raise RuntimeError(f"The project name: '{script_arguments.project_name}' is not pascal-cased.")
 
-    if directory_exists(script_arguments.project_name):
-        raise RuntimeError(
-            f"The directory: '{script_arguments.project_name}' already exists in the current working directory.")
-
     if not domain_is_valid(script_arguments.domain):
         raise RuntimeError(f"The domain: '{script_arguments.domain}' is invalid.")
 
@@ -65,7 +122,7 @@ def validated_script_arguments(script_arguments: Namespace) -> Mapping[str, Unio
 
 def create_configuration_accessor(project_name: str, project_domain: str,
                                   project_packages: List) -> ConfigurationAccessorType:
-    configuration: Mapping[str, ConfigurationType] = {
+    configuration: Mapping[str, ConfigurationType] = MappingProxyType({
         'project.name': project_name,
         'project.domain': project_domain,
         'project.packages': project_packages,
@@ -81,11 +138,7 @@ def create_configuration_accessor(project_name: str, project_domain: str,
         'services.mailhog.port': 8025,
 
         'miscellaneous.node.image.tag': 'stretch',
-    }
-
-    def _accessor(key: str) -> ConfigurationType:
-        nonlocal configuration
-
-        return configuration[key]
+    })
 
-    return _accessor
+    # The read-only mapping's own lookup is the accessor; no wrapping function is needed.
+    return configuration.__getitem__
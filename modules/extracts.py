@@ -1,49 +1,181 @@
-from fileinput import input
-from os import getuid, getgid, getcwd
+from functools import lru_cache
+from json import dumps, loads
+from os import getuid, getgid, replace, stat
 from pathlib import Path
-from re import compile, Match, Pattern
-from shutil import copyfile
-from string import Template
-from subprocess import run
-from typing import Mapping, Union
+from shutil import copymode, which
+from subprocess import CalledProcessError, DEVNULL, PIPE, Popen, run
+from sys import stdin
+from tempfile import NamedTemporaryFile
+from time import time
+from typing import List, Mapping, Optional, Tuple, TYPE_CHECKING, Union
 
 from modules.configuration import ConfigurationAccessorType
-from modules.configuration import create_argument_parser, validated_script_arguments, create_configuration_accessor
+from modules.configuration import parse_script_arguments, validated_script_arguments, create_configuration_accessor
 from modules.packages import setup_breeze, setup_horizon, setup_telescope
 from modules.ssl import Generator as SslGenerator
-from modules.utilities import cd, migrate_database, start_stack, template_path
-from modules.verification import correct_version_is_installed
+from modules.utilities import cd, commit_all_changes, copy_template, migrate_database, render_template, start_stack
+from modules.verification import parse_version, version_satisfies
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+USER_ID: int = getuid()
+GROUP_ID: int = getgid()
+
+REQUIREMENTS: Mapping[str, str] = {
+    'docker.version': '20.10.5',
+    'docker-compose.version': '1.28.0',
+    'git.version': '2.31.0',
+}
+
+# (version command, requirement, error message) for every dependency checked before setting a project up.
+PREFLIGHT_CHECKS: Tuple[Tuple[Tuple[str, ...], str, str], ...] = (
+    (
+        ('docker', 'version', '--format', '{{.Server.Version}}'),
+        'docker.version',
+        'The correct docker version is not installed. Docker >= v{} is needed.'
+    ),
+    (
+        ('docker-compose', 'version', '--short'),
+        'docker-compose.version',
+        'The correct docker-compose version is not installed. Docker-Compose >= v{} is needed.'
+    ),
+    (
+        ('git', 'version'),
+        'git.version',
+        'The correct git version is not installed. Git >= v{} is needed.'
+    ),
+)
+
+# The docker server's version comes from its daemon, which can be stopped or upgraded without its client changing,
+# so this check is run every time instead of being cached.
+UNCACHED_PREFLIGHT_CHECKS: Tuple[str, ...] = ('docker.version',)
+
+PREFLIGHT_CACHE: Path = Path.home() / '.cache/laravel-setup/preflight.json'
+PREFLIGHT_CACHE_LIFETIME: int = 24 * 60 * 60
+
+
+def tools_modification_times() -> Optional[Mapping[str, float]]:
+    """
+    Gets the modification time of the executable of every tool checked by the cached preflight checks. Upgrading a
+    tool replaces its executable, which invalidates the cached result of the checks.
+
+    Returns:
+        The modification times keyed by tool, or None if one of the tools cannot be found.
+    """
+    executables: Mapping[str, Optional[str]] = {
+        command[0]: which(command[0])
+        for command, requirement, _ in PREFLIGHT_CHECKS
+        if requirement not in UNCACHED_PREFLIGHT_CHECKS
+    }
 
+    if None in executables.values():
+        return None
+
+    return {tool: stat(executable).st_mtime for tool, executable in executables.items()}
+
+
+def preflight_checks_are_cached(modification_times: Mapping[str, float]) -> bool:
+    """
+    Checks whether the preflight checks recently succeeded against the same requirements, with the same tools
+    installed.
+
+    Args:
+        modification_times: The current modification times of the tools' executables.
+
+    Returns:
+        True if the cached success is less than a day old and neither the requirements nor the tools have changed since.
+    """
+    try:
+        cache: Mapping = loads(PREFLIGHT_CACHE.read_text())
+    except (OSError, ValueError):
+        return False
+
+    if not isinstance(cache, dict):
+        return False
+
+    timestamp: Optional[float] = cache.get('timestamp')
+
+    return (
+            isinstance(timestamp, (int, float))
+            and
+            # A timestamp in the future cannot come from a previous run.
+            0 <= time() - timestamp < PREFLIGHT_CACHE_LIFETIME
+            and
+            cache.get('requirements') == REQUIREMENTS
+            and
+            cache.get('tools') == modification_times
+    )
+
+
+def cache_preflight_checks(modification_times: Mapping[str, float]) -> None:
+    """
+    Records a success of the preflight checks on disk.
 
+    Args:
+        modification_times: The current modification times of the tools' executables.
+    """
+    try:
+        PREFLIGHT_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        PREFLIGHT_CACHE.write_text(dumps(
+            {'timestamp': time(), 'requirements': REQUIREMENTS, 'tools': modification_times}
+        ))
+    except OSError:
+        # The cache is only an optimization; failing to write it must not prevent the project's setup.
+        pass
+
+
+@lru_cache(maxsize=None)
 def preflight_checks() -> None:
     """
     Checks whether the correct version of the dependencies are installed.
+    Installed versions do not change during a run, so only the first successful call runs the checks. A success is
+    also cached on disk for a day, as long as neither the requirements nor the tools change; the checks that depend on
+    a running daemon are not cached.
+
+    Raises:
+        RuntimeError: If one of the dependencies is older than required.
+        CalledProcessError: If one of the version commands fails.
     """
-    requirements: Mapping[str, str] = {
-        'docker.version': '20.10.5',
-        'docker-compose.version': '1.28.0',
-        'git.version': '2.31.0',
-    }
+    from concurrent.futures import as_completed, ThreadPoolExecutor
 
-    if not correct_version_is_installed(
-            ('docker', 'version', '--format', '{{.Server.Version}}'), requirements['docker.version']):
-        raise RuntimeError(
-            'The correct docker version is not installed. '
-            f"Docker >= v{requirements['docker.version']} is needed."
-        )
+    modification_times: Optional[Mapping[str, float]] = tools_modification_times()
+    cached: bool = modification_times is not None and preflight_checks_are_cached(modification_times)
 
-    if not correct_version_is_installed(
-            ('docker-compose', 'version', '--short'), requirements['docker-compose.version']):
-        raise RuntimeError(
-            'The correct docker-compose version is not installed. '
-            f"Docker-Compose >= v{requirements['docker-compose.version']} is needed."
-        )
+    checks: Tuple[Tuple[Tuple[str, ...], str, str], ...] = tuple(
+        check for check in PREFLIGHT_CHECKS if not cached or check[1] in UNCACHED_PREFLIGHT_CHECKS
+    )
 
-    if not correct_version_is_installed(
-            ('git', 'version'), requirements['git.version']):
-        raise RuntimeError(
-            f"The correct git version is not installed. Git >= v{requirements['git.version']} is needed."
-        )
+    # The version commands are independent of each other, so they are run concurrently. The first failing check to
+    # complete is reported right away, and the commands still running are killed so that the script exits with it.
+    processes: List[Popen] = []
+    executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=len(checks))
+
+    try:
+        futures: Mapping['Future', Tuple[Popen, str, str]] = {}
+
+        for command, requirement, error_message in checks:
+            process: Popen = Popen(command, stdout=PIPE, stderr=DEVNULL)
+            processes.append(process)
+            futures[executor.submit(process.communicate)] = (process, requirement, error_message)
+
+        for future in as_completed(futures):
+            process, requirement, error_message = futures[future]
+            output, _ = future.result()
+
+            if process.returncode != 0:
+                raise CalledProcessError(process.returncode, process.args)
+
+            if not version_satisfies(parse_version(output), REQUIREMENTS[requirement]):
+                raise RuntimeError(error_message.format(REQUIREMENTS[requirement]))
+    finally:
+        for process in processes:
+            process.kill()
+
+        executor.shutdown()
+
+    if modification_times is not None and not cached:
+        cache_preflight_checks(modification_times)
 
 
 def configure() -> ConfigurationAccessorType:
@@ -52,127 +184,123 @@ def configure() -> ConfigurationAccessorType:
     """
     return create_configuration_accessor(
         **validated_script_arguments(
-            create_argument_parser().parse_args()
+            parse_script_arguments()
         )
     )
 
 
 def generate_configuration_files(configuration: ConfigurationAccessorType) -> None:
-    with cd(configuration('project.name')):
-        with cd('configuration/nginx/ssl'):
-            ssl_generator: SslGenerator = SslGenerator(
-                domain=configuration('project.domain'),
-                certificate_name=configuration('services.nginx.ssl.certificate.name'),
-                key_name=configuration('services.nginx.ssl.key.name')
-            )
-
-            if not ssl_generator.binary_is_present():
-                ssl_generator.build_binary()
-
-            ssl_generator.generate()
-
-        with open('docker-compose.yml', 'w') as file, open(f"{template_path('docker-compose.yml')}") as template:
-            file.write(
-                Template(template.read()).substitute({
-                    'PROJECT_NAME': configuration('project.name'),
-                    'USER_ID': getuid(),
-                    'GROUP_ID': getgid(),
-                    'POSTGRES_DB': configuration('services.postgres.database'),
-                    'POSTGRES_USER': configuration('services.postgres.username'),
-                    'POSTGRES_PASSWORD': configuration('services.postgres.password'),
-                    'ADMINER_PORT': configuration('services.adminer.port'),
-                    'MAILHOG_PORT': configuration('services.mailhog.port'),
-                })
-            )
-
-        with open('run', 'w') as file, open(f"{template_path('run')}") as template:
-            file.write(
-                Template(template.read()).substitute({
-                    'PROJECT_NAME': configuration('project.name'),
-                    'NODE_IMAGE_TAG': configuration('miscellaneous.node.image.tag'),
-                })
-            )
-
-        Path('run').chmod(0o755)
-
-        copyfile(template_path('.gitignore'), f'{Path.cwd()}/.gitignore')
-
-        with open('README.md', 'w') as file, open(f"{template_path('README.md')}") as template:
-            file.write(
-                Template(template.read()).substitute({
-                    'PROJECT_NAME': configuration('project.name'),
-                    'PROJECT_DOMAIN': configuration('project.domain'),
-                    'SSL_KEY_NAME': configuration('services.nginx.ssl.key.name'),
-                    'SSL_CERTIFICATE_NAME': configuration('services.nginx.ssl.certificate.name'),
-                    'ADMINER_PORT': configuration('services.adminer.port'),
-                    'MAILHOG_PORT': configuration('services.mailhog.port'),
-                })
-            )
-
-        with cd('configuration'):
-            with cd('nginx/conf.d'):
-                with open('default.conf', 'w') as file, \
-                        open(f"{template_path('configuration/nginx/conf.d/default.conf')}") as template:
-                    file.write(
-                        Template(template.read()).substitute({
-                            'PROJECT_DOMAIN': configuration('project.domain'),
-                            'SSL_KEY_NAME': configuration('services.nginx.ssl.key.name'),
-                            'SSL_CERTIFICATE_NAME': configuration('services.nginx.ssl.certificate.name'),
-                        })
-                    )
-
-                with open('utils.conf', 'w') as file, \
-                        open(f"{template_path('configuration/nginx/conf.d/utils.conf')}") as template:
-                    file.write(
-                        Template(template.read()).substitute({
-                            'PROJECT_DOMAIN': configuration('project.domain'),
-                            'ADMINER_PORT': configuration('services.adminer.port'),
-                            'MAILHOG_PORT': configuration('services.mailhog.port'),
-                        })
-                    )
-
-            with cd('supervisor/conf.d'):
-                copyfile(
-                    template_path('configuration/supervisor/conf.d/supervisord.conf'),
-                    f'{Path.cwd()}/supervisord.conf'
-                )
-
-        with cd('docker-compose/services/php'):
-            copyfile(template_path('docker-compose/services/php/Dockerfile'), f'{Path.cwd()}/Dockerfile')
+    from concurrent.futures import ThreadPoolExecutor
+
+    project_name: str = configuration('project.name')
+    project_domain: str = configuration('project.domain')
+    ssl_certificate_name: str = configuration('services.nginx.ssl.certificate.name')
+    ssl_key_name: str = configuration('services.nginx.ssl.key.name')
+
+    project: Path = Path(project_name)
+
+    ssl_generator: SslGenerator = SslGenerator(
+        domain=project_domain,
+        certificate_name=ssl_certificate_name,
+        key_name=ssl_key_name
+    )
+
+    if not ssl_generator.binary_is_present():
+        ssl_generator.build_binary()
+
+    ssl_generator.generate(project / 'configuration/nginx/ssl')
+
+    substitutions: Mapping[str, Union[str, int]] = {
+        'PROJECT_NAME': project_name,
+        'PROJECT_DOMAIN': project_domain,
+        'USER_ID': USER_ID,
+        'GROUP_ID': GROUP_ID,
+        'SSL_KEY_NAME': ssl_key_name,
+        'SSL_CERTIFICATE_NAME': ssl_certificate_name,
+        'POSTGRES_DB': configuration('services.postgres.database'),
+        'POSTGRES_USER': configuration('services.postgres.username'),
+        'POSTGRES_PASSWORD': configuration('services.postgres.password'),
+        'ADMINER_PORT': configuration('services.adminer.port'),
+        'MAILHOG_PORT': configuration('services.mailhog.port'),
+        'NODE_IMAGE_TAG': configuration('miscellaneous.node.image.tag'),
+    }
+
+    # Every template is rendered (or copied) to the same path, relative to the project's directory.
+    renders: Tuple[str, ...] = (
+        'docker-compose.yml',
+        'run',
+        'README.md',
+        'configuration/nginx/conf.d/default.conf',
+        'configuration/nginx/conf.d/utils.conf',
+    )
+    copies: Tuple[str, ...] = (
+        '.gitignore',
+        'configuration/supervisor/conf.d/supervisord.conf',
+        'docker-compose/services/php/Dockerfile',
+    )
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures: List['Future'] = [
+            *(executor.submit(render_template, render, project / render, substitutions) for render in renders),
+            *(executor.submit(copy_template, copy, project / copy) for copy in copies),
+        ]
+
+        for future in futures:
+            future.result()
+
+    (project / 'run').chmod(0o755)
 
 
 def pull_fresh_laravel_project(configuration: ConfigurationAccessorType) -> None:
-    with cd(f"{configuration('project.name')}/application/core"):
+    project_name: str = configuration('project.name')
+    core_directory: Path = Path(project_name, 'application/core').absolute()
+
+    # Composer's download cache is kept on the host so that subsequent projects do not re-fetch every package.
+    composer_cache_directory: Path = Path.home() / '.cache/composer'
+    composer_cache_directory.mkdir(parents=True, exist_ok=True)
+
+    run(
+        (
+            'docker', 'run',
+            '--rm',
+            *(('--interactive', '--tty') if stdin.isatty() else ()),
+            '--user', f'{USER_ID}:{GROUP_ID}',
+            '--mount', f'type=bind,source={core_directory},target=/application',
+            '--mount', f'type=bind,source={composer_cache_directory},target=/tmp/cache',
+            '--env', 'COMPOSER_CACHE_DIR=/tmp/cache',
+            '--workdir', '/application',
+            'composer', 'create-project',
+            '--prefer-dist',
+            '--ignore-platform-reqs',
+            'laravel/laravel', project_name,
+        ),
+        check=True
+    )
+
+
+def initialize_git_repository(configuration: ConfigurationAccessorType) -> None:
+    with cd(f"{configuration('project.name')}/application/core/{configuration('project.name')}"):
         run(
             (
-                'docker', 'run',
-                '--rm',
-                '--interactive',
-                '--tty',
-                '--user', f'{getuid()}:{getgid()}',
-                '--mount', f'type=bind,source={getcwd()},target=/application',
-                '--workdir', '/application',
-                'composer', 'create-project',
-                '--prefer-dist',
-                '--ignore-platform-reqs',
-                'laravel/laravel', configuration('project.name'),
+                'sh', '-c',
+                'git init'
+                ' && git add --all'
+                " && git commit --message 'initial commit'"
+                ' && git checkout -b development'
             ),
+            stdin=DEVNULL,
+            stdout=DEVNULL,
             check=True
         )
 
 
-def initialize_git_repository(configuration: ConfigurationAccessorType) -> None:
-    with cd(f"{configuration('project.name')}/application/core/{configuration('project.name')}"):
-        run(('git', 'init'), check=True)
-        run(('git', 'add', '*'), check=True)
-        run(('git', 'commit', '--message', 'initial commit'), check=True)
-        run(('git', 'checkout', '-b', 'development'), check=True)
-
-
 def configure_environment_variables(configuration: ConfigurationAccessorType) -> None:
+    project_name: str = configuration('project.name')
+    project_domain: str = configuration('project.domain')
+
     environment: Mapping[str, Union[str, int]] = {
-        'APP_NAME': configuration('project.name'),
-        'APP_URL': f"https://{configuration('project.domain')}",
+        'APP_NAME': project_name,
+        'APP_URL': f'https://{project_domain}',
 
         'DB_CONNECTION': 'pgsql',
         'DB_HOST': 'postgresql',
@@ -190,42 +318,50 @@ def configure_environment_variables(configuration: ConfigurationAccessorType) ->
 
         'MAIL_HOST': 'mailhog',
         'MAIL_PORT': 1025,
-        'MAIL_FROM_NAME': configuration('project.name').lower(),
-        'MAIL_FROM_ADDRESS': f"{configuration('project.name').lower()}@{configuration('project.domain')}"
+        'MAIL_FROM_NAME': project_name.lower(),
+        'MAIL_FROM_ADDRESS': f'{project_name.lower()}@{project_domain}'
     }
 
-    with cd(f"{configuration('project.name')}/application/core/{configuration('project.name')}"):
+    with cd(f'{project_name}/application/core/{project_name}'):
         for environment_file in ['.env', '.env.example']:
-            with input(environment_file, inplace=True) as file:
-                environment_regex: Pattern = compile(r'^(?P<key>\w+)=(?P<value>.*?)?\s*$')
+            lines: List[str] = []
 
-                for line in file:
-                    line: str = line.strip()
-                    matches: Match = environment_regex.match(line)
+            for line in Path(environment_file).read_text().splitlines():
+                line: str = line.strip()
+                # Only KEY=value lines whose key is overridden are rewritten; every key in the environment mapping is a
+                # valid variable name, so no further validation of the key is needed.
+                key, separator, _ = line.partition('=')
 
-                    if matches is not None:
-                        matches: Mapping[str, str] = matches.groupdict()
-                        line = (f"{matches['key']}="
-                                f"{environment[matches['key']] if matches['key'] in environment else matches['value']}")
+                if separator and key in environment:
+                    line = f'{key}={environment[key]}'
 
-                    print(line)
+                lines.append(f'{line}\n')
 
-        run(('git', 'add', '*'), check=True)
-        run(('git', 'commit', '--message', 'set environment variables for the project.'), check=True)
+            # The file is rewritten into a temporary sibling which then replaces it, so that it is never left
+            # half-written.
+            with NamedTemporaryFile('w', dir='.', prefix=f'{environment_file}.', delete=False) as destination:
+                destination.write(''.join(lines))
 
-    with cd(configuration('project.name')):
+            copymode(environment_file, destination.name)
+            replace(destination.name, environment_file)
+
+        commit_all_changes('set environment variables for the project.', tracked_only=True)
+
+    with cd(project_name):
         with start_stack():
             migrate_database()
 
 
 def setup_laravel_packages(configuration: ConfigurationAccessorType) -> None:
-    if 'breeze.inertia' in configuration('project.packages'):
+    project_packages: List[str] = configuration('project.packages')
+
+    if 'breeze.inertia' in project_packages:
         setup_breeze(configuration, inertia=True)
-    elif 'breeze' in configuration('project.packages'):
+    elif 'breeze' in project_packages:
         setup_breeze(configuration)
 
-    if 'horizon' in configuration('project.packages'):
+    if 'horizon' in project_packages:
         setup_horizon(configuration)
 
-    if 'telescope' in configuration('project.packages'):
+    if 'telescope' in project_packages:
         setup_telescope(configuration)
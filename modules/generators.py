@@ -1,15 +1,31 @@
-from pathlib import Path
-from typing import List
+from pathlib import Path, PurePath
+from typing import Tuple, Union
 
+PROJECT_DIRECTORIES: Tuple[str, ...] = (
+    'configuration/nginx/conf.d',
+    'configuration/nginx/ssl',
+    'configuration/supervisor/conf.d',
+    'docker-compose/services/php',
+    'application/core',
+)
 
-def setup_directory_structure(project_name: str) -> None:
-    directories: List[str] = [
-        f'{project_name}/configuration/nginx/conf.d',
-        f'{project_name}/configuration/nginx/ssl',
-        f'{project_name}/configuration/supervisor/conf.d',
-        f'{project_name}/docker-compose/services/php',
-        f'{project_name}/application/core',
-    ]
+# Every directory of the project, each one after its parent, so that each is created by exactly one mkdir call instead
+# of mkdir(parents=True) failing on, then recursing into, every missing ancestor.
+PROJECT_DIRECTORY_TREE: Tuple[PurePath, ...] = tuple(dict.fromkeys(
+    PurePath(*parts[:depth])
+    for parts in (PurePath(directory).parts for directory in PROJECT_DIRECTORIES)
+    for depth in range(1, len(parts) + 1)
+))
 
-    for directory in directories:
-        Path(directory).mkdir(parents=True, exist_ok=True)
+
+def setup_directory_structure(project_name: str, base_path: Union[str, Path] = '.') -> None:
+    project: Path = Path(base_path, project_name)
+
+    try:
+        project.mkdir()
+    except FileExistsError:
+        raise RuntimeError(f"The directory: '{project}' already exists.")
+
+    # The project's directory was just created, so none of its subdirectories exist yet.
+    for directory in PROJECT_DIRECTORY_TREE:
+        (project / directory).mkdir()
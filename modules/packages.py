@@ -1,13 +1,14 @@
-from re import compile, escape
 from subprocess import run
 from typing import Tuple
 
 from modules.configuration import ConfigurationAccessorType
-from modules.utilities import cd, migrate_database, start_stack, template_path
+from modules.utilities import cd, commit_all_changes, migrate_database, read_template, replace_line, start_stack
 
 
 def setup_breeze(configuration: ConfigurationAccessorType, *, inertia: bool = False) -> None:
-    with cd(configuration('project.name')):
+    project_name: str = configuration('project.name')
+
+    with cd(project_name):
         with start_stack():
             run(('./run', 'composer', 'require', 'laravel/breeze', '--dev'), check=True)
 
@@ -23,60 +24,51 @@ def setup_breeze(configuration: ConfigurationAccessorType, *, inertia: bool = Fa
 
             migrate_database()
 
-        with cd(f"application/core/{configuration('project.name')}"):
-            run(('git', 'add', '*'), check=True)
-            run(('git', 'commit', '--message', f'scaffold laravel/breeze package{" with inertia" if inertia else ""}.'),
-                check=True)
+        with cd(f'application/core/{project_name}'):
+            commit_all_changes(f'scaffold laravel/breeze package{" with inertia" if inertia else ""}.')
 
 
 def setup_horizon(configuration: ConfigurationAccessorType) -> None:
-    with cd(configuration('project.name')):
+    project_name: str = configuration('project.name')
+
+    with cd(project_name):
         with start_stack():
             run(('./run', 'composer', 'require', 'laravel/horizon'), check=True)
             run(('./run', 'artisan', 'horizon:install'), check=True)
             migrate_database()
 
-        with cd(f"application/core/{configuration('project.name')}/app/Console"):
-            with open('Kernel.php', 'r+') as file:
-                file_contents = file.read()
-                command_regex = compile(r' *' + escape("// $schedule->command('inspire')->hourly();"))
-                new_file_contents = command_regex.sub(
-                    "        $schedule->command('horizon:snapshot')->everyFiveMinutes();",
-                    file_contents
-                )
-
-                file.seek(0)
-                file.write(new_file_contents)
-                file.truncate()
+        replace_line(
+            f'application/core/{project_name}/app/Console/Kernel.php',
+            "// $schedule->command('inspire')->hourly();",
+            "        $schedule->command('horizon:snapshot')->everyFiveMinutes();"
+        )
 
-        with cd(f"application/core/{configuration('project.name')}"):
-            run(('git', 'add', '*'), check=True)
-            run(('git', 'commit', '--message', 'scaffold laravel/horizon package.'), check=True)
+        with cd(f'application/core/{project_name}'):
+            commit_all_changes('scaffold laravel/horizon package.')
 
         with cd('configuration/supervisor/conf.d'):
-            with open('supervisord.conf', 'a') as supervisord_configuration, open(
-                    template_path('configuration/supervisor/conf.d/supervisord.horizon.conf')) as horizon_configuration:
-                supervisord_configuration.write(f'\n{horizon_configuration.read()}')
+            with open('supervisord.conf', 'a', encoding='utf-8') as supervisord_configuration:
+                supervisord_configuration.write(
+                    f"\n{read_template('configuration/supervisor/conf.d/supervisord.horizon.conf')}")
 
 
 def setup_telescope(configuration: ConfigurationAccessorType) -> None:
-    with cd(configuration('project.name')):
+    project_name: str = configuration('project.name')
+
+    with cd(project_name):
         with start_stack():
             run(('./run', 'composer', 'require', 'laravel/telescope', '--dev'), check=True)
             run(('./run', 'artisan', 'telescope:install'), check=True)
             migrate_database()
 
-        with cd(f"application/core/{configuration('project.name')}"):
-            with cd('app/Providers'):
-                with open('TelescopeServiceProvider.php', 'r+') as file:
-                    file_contents = file.read()
-                    file.seek(0)
-                    method_regex = compile(r' *' + escape('public function register()'))
-                    new_file_contents = method_regex.sub('''\
+        replace_line(
+            f'application/core/{project_name}/app/Providers/TelescopeServiceProvider.php',
+            'public function register()',
+            '''\
     public function register()
     {
         if ($this->app->isLocal()) {
-            $this->app->register(\\\\Laravel\\\\Telescope\\\\TelescopeServiceProvider::class);
+            $this->app->register(\\Laravel\\Telescope\\TelescopeServiceProvider::class);
             $this->registerTelescope();
         }
     }
@@ -86,24 +78,18 @@ def setup_telescope(configuration: ConfigurationAccessorType) -> None:
      * @return void
      */
     protected function registerTelescope()\
-''', file_contents)
-
-                    file.write(new_file_contents)
-                    file.truncate()
+'''
+        )
 
-            with open('composer.json', 'r+') as file:
-                file_contents = file.read()
-                file.seek(0)
-                method_regex = compile(r' *' + escape('"dont-discover": []') + r'\n')
-                new_file_contents = method_regex.sub('''\
+        replace_line(
+            f'application/core/{project_name}/composer.json',
+            '"dont-discover": []',
+            '''\
             "dont-discover": [
                 "laravel/telescope"
-            ]
-''', file_contents)
-
-                file.write(new_file_contents)
-                file.truncate()
+            ]\
+'''
+        )
 
-        with cd(f"application/core/{configuration('project.name')}"):
-            run(('git', 'add', '*'), check=True)
-            run(('git', 'commit', '--message', 'scaffold laravel/telescope package.'), check=True)
+        with cd(f'application/core/{project_name}'):
+            commit_all_changes('scaffold laravel/telescope package.')
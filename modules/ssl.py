@@ -1,9 +1,10 @@
-from os import getcwd
+from os import replace
 from pathlib import Path
 from shutil import move
-from subprocess import run
+from subprocess import CalledProcessError, DEVNULL, Popen, run
+from typing import Optional, Union
 
-from modules.utilities import cd, project_path, tmpdir
+from modules.utilities import project_path, tmpdir
 
 
 class Generator:
@@ -15,42 +16,73 @@ class Generator:
         self.__src_dirname: str = 'minica_src'
         self.__binary_name: str = 'minica'
         self.__binary_directory: Path = project_path('tools/ssl')
+        self.__builder_image: str = 'golang:1.14'
 
     def binary_is_present(self) -> bool:
         return project_path(f'tools/ssl/{self.__binary_name}').is_file()
 
+    def builder_image_is_present(self) -> bool:
+        return run(
+            ('docker', 'image', 'inspect', self.__builder_image),
+            stdin=DEVNULL,
+            stdout=DEVNULL,
+            stderr=DEVNULL
+        ).returncode == 0
+
     def build_binary(self) -> None:
-        with tmpdir():
-            run(('git', 'clone', 'https://github.com/jsha/minica.git', self.__src_dirname))
-
-            with cd(self.__src_dirname):
-                run(
-                    (
-                        'docker', 'run',
-                        '--rm',
-                        '--mount', f'type=bind,source={getcwd()},target=/usr/src/myapp',
-                        '--workdir', '/usr/src/myapp',
-                        'golang:1.14',
-                        'go', 'build'
-                    ),
-                    check=True
-                )
-
-                move(Path(self.__binary_name).absolute(),
-                     Path(f'{self.__binary_directory}/{self.__binary_name}').absolute())
-
-    def generate(self) -> None:
-        project_certificates_directory: str = getcwd()
-
-        with cd(self.__binary_directory):
-            generated_certificates_directory: Path = Path(self.__domain)
+        # The sources are cloned next to the binary's destination, so that moving the built binary is a mere rename.
+        with tmpdir(self.__binary_directory) as temporary_directory:
+            src_directory: Path = temporary_directory / self.__src_dirname
+
+            # A missing builder image is pulled while the sources are cloned, instead of by docker run once the clone is
+            # done. An image that is already present is used as is, as docker run would, so no registry is contacted.
+            pull: Optional[Popen] = None
+
+            if not self.builder_image_is_present():
+                pull = Popen(('docker', 'pull', '--quiet', self.__builder_image), stdin=DEVNULL, stdout=DEVNULL)
 
             try:
-                run((f'./{self.__binary_name}', '--domains', f'{self.__domain},*.{self.__domain}'))
-
-                with cd(generated_certificates_directory):
-                    move(Path('cert.pem').absolute(), f'{project_certificates_directory}/{self.__certificate_name}')
-                    move(Path('key.pem').absolute(), f'{project_certificates_directory}/{self.__key_name}')
-            finally:
-                if generated_certificates_directory.is_dir():
-                    generated_certificates_directory.rmdir()
+                # Only the sources of the latest revision are needed, not the repository's history.
+                run(('git', 'clone', '--depth', '1', 'https://github.com/jsha/minica.git', src_directory), check=True)
+            except BaseException:
+                if pull is not None:
+                    pull.kill()
+                    pull.wait()
+
+                raise
+
+            if pull is not None and pull.wait() != 0:
+                raise CalledProcessError(pull.returncode, pull.args)
+
+            run(
+                (
+                    'docker', 'run',
+                    '--rm',
+                    '--mount', f'type=bind,source={src_directory},target=/usr/src/myapp',
+                    '--workdir', '/usr/src/myapp',
+                    self.__builder_image,
+                    'go', 'build'
+                ),
+                check=True
+            )
+
+            replace(src_directory / self.__binary_name, self.__binary_directory / self.__binary_name)
+
+    def generate(self, directory: Union[str, Path]) -> None:
+        project_certificates_directory: Path = Path(directory)
+        generated_certificates_directory: Path = self.__binary_directory / self.__domain
+
+        try:
+            # minica writes the certificates in a directory named after the domain, relative to its working directory.
+            run(
+                (str(self.__binary_directory / self.__binary_name), '--domains', f'{self.__domain},*.{self.__domain}'),
+                cwd=self.__binary_directory
+            )
+
+            move(generated_certificates_directory / 'cert.pem',
+                 project_certificates_directory / self.__certificate_name)
+            move(generated_certificates_directory / 'key.pem',
+                 project_certificates_directory / self.__key_name)
+        finally:
+            if generated_certificates_directory.is_dir():
+                generated_certificates_directory.rmdir()
@@ -1,41 +1,51 @@
 from contextlib import contextmanager
+from functools import lru_cache
 from os import chdir, getcwd
 from pathlib import Path
-from subprocess import run
+from shlex import quote
+from subprocess import DEVNULL, run
 from tempfile import TemporaryDirectory
-from typing import Union
+from typing import Callable, Iterator, List, Mapping, Optional, Tuple, Union
+
+PROJECT_ROOT: Path = Path(__file__).parent.parent
+TEMPLATES_ROOT: Path = PROJECT_ROOT / 'templates'
 
 
 @contextmanager
-def cd(destination: Union[str, Path]) -> None:
+def cd(destination: Union[str, Path]) -> Iterator[Path]:
     """
     A context manager to change directory. Mimics unix's cd.
 
     Args:
         destination (str|Path): The directory to cd into.
+
+    Yields:
+        The absolute path of the destination, so that callers do not need to query the new working directory.
     """
     current_working_directory: str = getcwd()
 
     try:
         chdir(str(destination))
-        yield
+        yield Path(current_working_directory, destination)
     finally:
         chdir(current_working_directory)
 
 
 @contextmanager
-def tmpdir() -> None:
+def tmpdir(directory: Optional[Union[str, Path]] = None) -> Iterator[Path]:
     """
-    A context manager to create a temporary directory and cd into it.
-    """
-    current_working_directory: str = getcwd()
+    A context manager to create a temporary directory, removed with its contents on exit. The working directory is
+    left untouched.
 
-    with TemporaryDirectory() as temporary_directory:
-        try:
-            chdir(temporary_directory)
-            yield
-        finally:
-            chdir(current_working_directory)
+    Args:
+        directory: The directory to create the temporary directory in. Defaults to the system's temporary directory.
+            Creating it on the same filesystem as where its contents end up lets them be moved out with a rename.
+
+    Yields:
+        The absolute path of the temporary directory.
+    """
+    with TemporaryDirectory(dir=directory) as temporary_directory:
+        yield Path(temporary_directory).absolute()
 
 
 @contextmanager
@@ -57,6 +67,49 @@ def migrate_database() -> None:
     run(('./run', 'artisan', 'migrate:fresh'), check=True)
 
 
+def commit_all_changes(message: str, *, tracked_only: bool = False) -> None:
+    """
+    Stage and commit every change in the current working directory's git repository. Both git commands are chained in
+    a single shell, so that only one process is spawned from python. They are not interactive, so they are detached
+    from the terminal's input and their output is discarded; errors are still reported on stderr.
+
+    Args:
+        message: The commit message.
+        tracked_only: Whether only the changes to already tracked files are committed, which spares git from scanning
+            the repository for untracked files.
+    """
+    run(('sh', '-c', f"git add {'--update' if tracked_only else '--all'} && git commit --message {quote(message)}"),
+        stdin=DEVNULL, stdout=DEVNULL, check=True)
+
+
+def replace_line(path: Union[str, Path], line: str, replacement: str) -> None:
+    """
+    Replace every line of a file that reads as the given one, whatever its indentation.
+
+    Args:
+        path: The file to edit.
+        line: The line to replace, without its indentation.
+        replacement: The text replacing each matching line, indentation included, without its trailing newline.
+
+    Raises:
+        RuntimeError: If no line of the file matches, so that an edit never silently does nothing.
+    """
+    file: Path = Path(path)
+    lines: List[str] = file.read_text(encoding='utf-8').splitlines(keepends=True)
+    matched: bool = False
+
+    for index, current in enumerate(lines):
+        if current.strip() == line:
+            # The line's own ending is kept, including its absence on a last line.
+            lines[index] = replacement + current[len(current.rstrip('\r\n')):]
+            matched = True
+
+    if not matched:
+        raise RuntimeError(f"The line: '{line}' was not found in: '{file}'.")
+
+    file.write_text(''.join(lines), encoding='utf-8')
+
+
 def project_path(path: str = '') -> Path:
     """
     Get a file's absolute path from a path relative to the root project directory.
@@ -67,9 +120,10 @@ def project_path(path: str = '') -> Path:
     Returns:
         A Path object pointing to the file.
     """
-    return Path(f'{Path(__file__).parent.parent}/{path}')
+    return PROJECT_ROOT / path
 
 
+@lru_cache(maxsize=64)
 def template_path(path: str) -> Path:
     """
     Get a template's absolute path from a path relative to the 'templates' directory.
@@ -80,4 +134,109 @@ def template_path(path: str) -> Path:
     Returns:
         A Path object pointing to the template.
     """
-    return project_path(f'templates/{path}')
+    return TEMPLATES_ROOT / path
+
+
+@lru_cache(maxsize=None)
+def read_template(path: str) -> str:
+    """
+    Read a template's contents. Templates do not change during a run, so each one is only read from disk once.
+
+    Args:
+        path: Template's path relative to the 'templates' directory.
+
+    Returns:
+        The contents of the template.
+    """
+    return template_path(path).read_text(encoding='utf-8')
+
+
+@lru_cache(maxsize=None)
+def read_template_bytes(path: str) -> bytes:
+    """
+    Read a template's raw contents, for templates copied as is. Each one is only read from disk once.
+
+    Args:
+        path: Template's path relative to the 'templates' directory.
+
+    Returns:
+        The undecoded contents of the template.
+    """
+    return template_path(path).read_bytes()
+
+
+@lru_cache(maxsize=None)
+def compile_template(path: str) -> Callable[[Mapping[str, Union[str, int]]], str]:
+    """
+    Compile a template into a function rendering it. The template is split on its placeholders ($NAME / ${NAME}) once;
+    rendering then only fills the placeholders' slots between the literal chunks and joins them, without any regex or
+    format-string parsing.
+
+    Args:
+        path: Template's path relative to the 'templates' directory.
+
+    Returns:
+        A function rendering the template with the given placeholder values.
+
+    Raises:
+        ValueError: If the template contains an invalid placeholder.
+    """
+    from string import Template
+
+    template: str = read_template(path)
+    chunks: List[str] = []
+    placeholders: List[Tuple[int, str]] = []
+    literal: List[str] = []
+    position: int = 0
+
+    for match in Template.pattern.finditer(template):
+        literal.append(template[position:match.start()])
+
+        if match.group('invalid') is not None:
+            raise ValueError(f"The template: '{path}' contains an invalid placeholder.")
+
+        if match.group('escaped') is not None:
+            literal.append('$')
+        else:
+            chunks.append(''.join(literal))
+            placeholders.append((len(chunks), match.group('named') or match.group('braced')))
+            chunks.append('')
+            literal = []
+
+        position = match.end()
+
+    literal.append(template[position:])
+    chunks.append(''.join(literal))
+
+    def _render(substitutions: Mapping[str, Union[str, int]]) -> str:
+        rendered: List[str] = chunks.copy()
+
+        for index, placeholder in placeholders:
+            rendered[index] = str(substitutions[placeholder])
+
+        return ''.join(rendered)
+
+    return _render
+
+
+def render_template(path: str, destination: Union[str, Path], substitutions: Mapping[str, Union[str, int]]) -> None:
+    """
+    Render a template and write the result to a file.
+
+    Args:
+        path: Template's path relative to the 'templates' directory.
+        destination: The file to write the rendered template to.
+        substitutions: The values of the template's placeholders.
+    """
+    Path(destination).write_bytes(compile_template(path)(substitutions).encode())
+
+
+def copy_template(path: str, destination: Union[str, Path]) -> None:
+    """
+    Copy a template, as is, to a file.
+
+    Args:
+        path: Template's path relative to the 'templates' directory.
+        destination: The file to copy the template to.
+    """
+    Path(destination).write_bytes(read_template_bytes(path))
@@ -1,52 +1,77 @@
-from pathlib import Path
+from functools import lru_cache
 from re import compile, IGNORECASE, Pattern
-from subprocess import run
-from typing import Tuple, Mapping
+from typing import List, Tuple, Union
 
+PASCAL_CASE_REGEX: Pattern = compile(r'[A-Z][a-z]+(?:[A-Z][a-z]+)*')
+# Only the domain name itself: the optional path following it is checked without the regex engine, which removes the
+# alternation the engine had to backtrack through.
+DOMAIN_REGEX: Pattern = compile(
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+(?:[A-Z]{2,6}\.?|[A-Z0-9-]{2,}\.?))',
+    IGNORECASE
+)
+# A bytes.translate table keeping the characters a version is made of, and turning every other one into a space.
+VERSION_TRANSLATION: bytes = bytes(
+    character if character in b'0123456789.' else ord(' ') for character in range(256)
+)
 
+
+@lru_cache(maxsize=256)
 def is_pascal_case(string: str) -> bool:
-    return compile(r'^[A-Z][a-z]+(?:[A-Z][a-z]+)*$').match(string) is not None
+    return PASCAL_CASE_REGEX.fullmatch(string) is not None
 
 
+@lru_cache(maxsize=256)
 def domain_is_valid(domain: str) -> bool:
-    return compile(
-        r'^'
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+(?:[A-Z]{2,6}\.?|[A-Z0-9-]{2,}\.?))'  # domain
-        r'(?:/?|[/?]\S+)'  # path
-        r'$',
-        IGNORECASE
-    ).match(domain) is not None
+    # A domain name contains neither '/' nor '?', so the first of them (if any) starts the path.
+    name_length: int = len(domain.split('/', 1)[0].split('?', 1)[0])
+    path: str = domain[name_length:]
+
+    return (
+            DOMAIN_REGEX.fullmatch(domain, 0, name_length) is not None
+            and
+            (path in ('', '/') or (len(path) > 1 and not any(character.isspace() for character in path)))
+    )
+
+
+def parse_version(text: Union[str, bytes]) -> Tuple[int, int, int]:
+    """
+    Finds the first version in the form "<major>.<minor>.<release>" in a text, without going through the regex engine.
+    The text is scanned as bytes, so that a program's output does not need to be decoded first.
+
+    Args:
+        text: The text containing the version, e.g. the output of a program's version command.
+
+    Returns:
+        The major, minor and release numbers of the version.
+
+    Raises:
+        ValueError: If the text does not contain any version.
+    """
+    raw: bytes = text.encode() if isinstance(text, str) else text
 
+    # Every character that cannot be part of a version separates the candidates.
+    for candidate in raw.translate(VERSION_TRANSLATION).split():
+        numbers: List[bytes] = candidate.split(b'.')
 
-def directory_exists(name: str) -> bool:
-    return Path(name).is_dir()
+        for index in range(len(numbers) - 2):
+            if numbers[index] and numbers[index + 1] and numbers[index + 2]:
+                return int(numbers[index]), int(numbers[index + 1]), int(numbers[index + 2])
 
+    raise ValueError(f"No version was found in: '{raw.decode(errors='replace')}'.")
 
-def correct_version_is_installed(version_command: Tuple[str, ...], required_version: str) -> bool:
+
+def version_satisfies(current_version: Tuple[int, int, int], required_version: str) -> bool:
     """
-    Checks whether the correct version of a program is installed.
+    Checks whether a version satisfies a requirement.
 
     Args:
-        version_command: The command that outputs the version of the program to stdout.
-        required_version: The required version of the command in the form "<major>.<minor>.<release>"
+        current_version: The major, minor and release numbers of the version.
+        required_version: The required version in the form "<major>.<minor>.<release>"
 
     Returns:
-        True if the current 'major' and 'minor' versions of the program are greater than or equal to the required ones.
+        True if the current 'major' and 'minor' versions are greater than or equal to the required ones.
     """
-    version_regex: Pattern = compile(r'.*?(?P<major>\d+)\.(?P<minor>\d+)\.(?P<release>\d+).*?')
-    current_version_map: Mapping[str, int] = {
-        label: int(version) for label, version in
-        version_regex.match(
-            run(version_command, capture_output=True, check=True).stdout.decode('utf-8')
-        ).groupdict().items()
-    }
-    required_version_map: Mapping[str, int] = {
-        label: int(version) for label, version in
-        version_regex.match(required_version).groupdict().items()
-    }
+    current_major, current_minor, _ = current_version
+    required_major, required_minor, _ = parse_version(required_version)
 
-    return (
-            current_version_map['major'] >= required_version_map['major']
-            and
-            current_version_map['minor'] >= required_version_map['minor']
-    )
+    return current_major >= required_major and current_minor >= required_minor
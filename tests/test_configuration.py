@@ -1,17 +1,21 @@
 from argparse import ArgumentParser, Namespace
-from os import mkdir
+from contextlib import redirect_stderr
+from io import StringIO
 from typing import List, Mapping, Union
 from unittest import TestCase
 
 from modules.configuration import ConfigurationAccessorType
-from modules.configuration import create_argument_parser, create_configuration_accessor, validated_script_arguments
-from modules.utilities import tmpdir
+from modules.configuration import create_argument_parser, create_configuration_accessor, parse_script_arguments, \
+    validated_script_arguments
 
 
 class ParserTestCase(TestCase):
     def setUp(self) -> None:
         self.argument_parser: ArgumentParser = create_argument_parser()
 
+    def test_parser_is_only_built_once(self) -> None:
+        self.assertIs(create_argument_parser(), self.argument_parser)
+
     def test_script_name_is_laravel(self) -> None:
         self.assertEqual(self.argument_parser.prog, 'laravel')
 
@@ -55,6 +59,38 @@ class ParserTestCase(TestCase):
         self.assertListEqual(arguments.__getattribute__('with'), choices)
 
 
+class ParseScriptArgumentsTestCase(TestCase):
+    def test_parses_arguments_like_the_argument_parser(self) -> None:
+        arguments_list: List[List[str]] = [
+            ['setup', 'One'],
+            ['setup', 'One', '--domain', 'example.local'],
+            ['setup', 'One', '--domain=example.local'],
+            ['setup', 'One', '--with'],
+            ['setup', 'One', '--with', 'breeze', 'horizon'],
+            ['setup', 'One', '--with', 'telescope', '--domain', 'example.local'],
+            ['setup', '--domain', 'example.local', 'One'],
+        ]
+
+        for arguments in arguments_list:
+            self.assertDictEqual(
+                vars(parse_script_arguments(arguments)),
+                vars(create_argument_parser().parse_args(arguments))
+            )
+
+    def test_exits_like_the_argument_parser_on_invalid_arguments(self) -> None:
+        arguments_list: List[List[str]] = [
+            [],
+            ['setup'],
+            ['setup', 'One', '--with', 'unknown'],
+            ['setup', 'One', '--unknown'],
+            ['setup', 'One', 'Two'],
+        ]
+
+        for arguments in arguments_list:
+            with self.assertRaises(SystemExit), redirect_stderr(StringIO()):
+                parse_script_arguments(arguments)
+
+
 class ValidatedScriptArgumentsTestCase(TestCase):
     def setUp(self) -> None:
         self.script_arguments: Namespace = Namespace()
@@ -65,17 +101,6 @@ class ValidatedScriptArgumentsTestCase(TestCase):
         with self.assertRaises(RuntimeError):
             validated_script_arguments(self.script_arguments)
 
-    def test_raises_runtime_error_if_directory_with_same_name_as_project_exists_in_cwd(self) -> None:
-        project_name: str = 'OneTwo'
-
-        self.script_arguments.__setattr__('project_name', project_name)
-
-        with tmpdir():
-            mkdir(project_name)
-
-            with self.assertRaises(RuntimeError):
-                validated_script_arguments(self.script_arguments)
-
     def test_raises_runtime_error_if_domain_name_is_invalid(self) -> None:
         self.script_arguments.__setattr__('project_name', 'CorrectProjectName')
         self.script_arguments.__setattr__('domain', 'invalid//domain::tld')
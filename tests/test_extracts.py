@@ -0,0 +1,152 @@
+from json import dumps, loads
+from os import environ, pathsep
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import time
+from typing import List, Mapping
+from unittest import TestCase
+from unittest.mock import patch
+
+from modules.extracts import REQUIREMENTS, PREFLIGHT_CACHE_LIFETIME, cache_preflight_checks, preflight_checks, \
+    preflight_checks_are_cached, tools_modification_times
+
+MODIFICATION_TIMES: Mapping[str, float] = {'docker-compose': 1.0, 'git': 2.0}
+
+# The version every fake tool outputs; each one also logs its own invocation.
+FAKE_TOOLS: Mapping[str, str] = {
+    'docker': '20.10.7',
+    'docker-compose': '1.29.0',
+    'git': 'git version 2.31.1',
+}
+
+
+class PreflightCacheTestCase(TestCase):
+    temporary_directory: TemporaryDirectory
+    cache: Path
+
+    def setUp(self) -> None:
+        self.temporary_directory = TemporaryDirectory()
+        self.cache = Path(self.temporary_directory.name, 'cache/preflight.json')
+
+        cache_patcher = patch('modules.extracts.PREFLIGHT_CACHE', self.cache)
+        cache_patcher.start()
+
+        self.addCleanup(cache_patcher.stop)
+        self.addCleanup(self.temporary_directory.cleanup)
+
+    def write_cache(self, **overrides) -> None:
+        self.cache.parent.mkdir(parents=True, exist_ok=True)
+        self.cache.write_text(dumps(
+            {'timestamp': time(), 'requirements': REQUIREMENTS, 'tools': MODIFICATION_TIMES, **overrides}
+        ))
+
+
+class PreflightChecksAreCachedTestCase(PreflightCacheTestCase):
+    def test_returns_true_for_a_recent_cache_with_the_same_requirements_and_tools(self) -> None:
+        self.write_cache()
+
+        self.assertTrue(preflight_checks_are_cached(MODIFICATION_TIMES))
+
+    def test_returns_false_when_there_is_no_cache(self) -> None:
+        self.assertFalse(preflight_checks_are_cached(MODIFICATION_TIMES))
+
+    def test_returns_false_for_a_corrupt_cache(self) -> None:
+        for content in ['', '{', '[]', 'null', '"timestamp"']:
+            with self.subTest(content=content):
+                self.cache.parent.mkdir(parents=True, exist_ok=True)
+                self.cache.write_text(content)
+
+                self.assertFalse(preflight_checks_are_cached(MODIFICATION_TIMES))
+
+    def test_returns_false_for_an_invalid_timestamp(self) -> None:
+        for timestamp in [None, '0', [], {}]:
+            with self.subTest(timestamp=timestamp):
+                self.write_cache(timestamp=timestamp)
+
+                self.assertFalse(preflight_checks_are_cached(MODIFICATION_TIMES))
+
+    def test_returns_false_for_a_timestamp_in_the_future(self) -> None:
+        self.write_cache(timestamp=time() + 60)
+
+        self.assertFalse(preflight_checks_are_cached(MODIFICATION_TIMES))
+
+    def test_returns_false_for_an_expired_cache(self) -> None:
+        self.write_cache(timestamp=time() - PREFLIGHT_CACHE_LIFETIME)
+
+        self.assertFalse(preflight_checks_are_cached(MODIFICATION_TIMES))
+
+    def test_returns_false_when_the_requirements_changed(self) -> None:
+        self.write_cache(requirements={**REQUIREMENTS, 'git.version': '2.0.0'})
+
+        self.assertFalse(preflight_checks_are_cached(MODIFICATION_TIMES))
+
+    def test_returns_false_when_the_tools_changed(self) -> None:
+        self.write_cache()
+
+        self.assertFalse(preflight_checks_are_cached({**MODIFICATION_TIMES, 'git': 3.0}))
+
+
+class CachePreflightChecksTestCase(PreflightCacheTestCase):
+    def test_writes_a_cache_that_is_read_back(self) -> None:
+        cache_preflight_checks(MODIFICATION_TIMES)
+
+        self.assertTrue(preflight_checks_are_cached(MODIFICATION_TIMES))
+
+    def test_ignores_a_cache_that_cannot_be_written(self) -> None:
+        self.cache.parent.parent.mkdir(parents=True, exist_ok=True)
+        self.cache.parent.write_text('')
+
+        cache_preflight_checks(MODIFICATION_TIMES)
+
+        self.assertFalse(preflight_checks_are_cached(MODIFICATION_TIMES))
+
+
+class PreflightChecksTestCase(PreflightCacheTestCase):
+    log: Path
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        tools: Path = Path(self.temporary_directory.name, 'bin')
+        tools.mkdir()
+
+        self.log = Path(self.temporary_directory.name, 'log')
+
+        for tool, output in FAKE_TOOLS.items():
+            self.write_tool(tools / tool, output)
+
+        path_patcher = patch.dict(environ, {'PATH': f'{tools}{pathsep}{environ["PATH"]}'})
+        path_patcher.start()
+
+        self.addCleanup(path_patcher.stop)
+
+        preflight_checks.cache_clear()
+        self.addCleanup(preflight_checks.cache_clear)
+
+    def write_tool(self, tool: Path, output: str) -> None:
+        tool.write_text(f'#!/bin/sh\necho "$(basename "$0")" >> "{self.log}"\necho "{output}"\n')
+        tool.chmod(0o755)
+
+    def probed_tools(self) -> List[str]:
+        return sorted(self.log.read_text().split()) if self.log.exists() else []
+
+    def test_caches_a_success(self) -> None:
+        preflight_checks()
+
+        self.assertEqual(self.probed_tools(), sorted(FAKE_TOOLS))
+        self.assertEqual(loads(self.cache.read_text())['tools'], tools_modification_times())
+
+    def test_only_probes_the_docker_daemon_when_the_checks_are_cached(self) -> None:
+        self.write_cache(tools=tools_modification_times())
+
+        preflight_checks()
+
+        self.assertEqual(self.probed_tools(), ['docker'])
+
+    def test_does_not_cache_a_failure(self) -> None:
+        self.write_tool(Path(self.temporary_directory.name, 'bin/git'), 'git version 2.0.0')
+
+        with self.assertRaises(RuntimeError):
+            preflight_checks()
+
+        self.assertFalse(self.cache.exists())
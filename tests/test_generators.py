@@ -1,25 +1,67 @@
-from pathlib import Path
-from typing import List
+from os import mkdir
+from pathlib import Path, PurePath
+from tempfile import mkdtemp, TemporaryDirectory
+from typing import Set
 from unittest import TestCase
 
 from modules.generators import setup_directory_structure
-from modules.utilities import tmpdir
+from modules.utilities import cd
 
 
 class CreateDirectoryStructureTestCase(TestCase):
+    # Every test works in its own subdirectory of a single temporary directory, which is removed once for all of them.
+    root_directory: TemporaryDirectory
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.root_directory = TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.root_directory.cleanup()
+
     def test_directories_are_properly_created(self) -> None:
-        with tmpdir():
-            project_name: str = 'OneTwo'
-
-            directories: List[str] = [
-                f'{project_name}/configuration/nginx/conf.d',
-                f'{project_name}/configuration/nginx/ssl',
-                f'{project_name}/configuration/supervisor/conf.d',
-                f'{project_name}/docker-compose/services/php',
-                f'{project_name}/application/core',
+        base_path: Path = Path(mkdtemp(dir=self.root_directory.name))
+        project_name: str = 'OneTwo'
+
+        directories: Set[PurePath] = {
+            PurePath(project_name, directory) for directory in [
+                '',
+                'configuration',
+                'configuration/nginx',
+                'configuration/nginx/conf.d',
+                'configuration/nginx/ssl',
+                'configuration/supervisor',
+                'configuration/supervisor/conf.d',
+                'docker-compose',
+                'docker-compose/services',
+                'docker-compose/services/php',
+                'application',
+                'application/core',
             ]
+        }
+
+        setup_directory_structure(project_name, base_path)
+
+        # A single walk of the created tree, which also ensures that no unexpected directory was created.
+        self.assertEqual(
+            {path.relative_to(base_path) for path in base_path.rglob('*') if path.is_dir()},
+            directories
+        )
+
+    def test_raises_runtime_error_if_directory_with_same_name_as_project_exists_in_base_path(self) -> None:
+        base_path: Path = Path(mkdtemp(dir=self.root_directory.name))
+        project_name: str = 'OneTwo'
+
+        mkdir(base_path / project_name)
+
+        with self.assertRaises(RuntimeError):
+            setup_directory_structure(project_name, base_path)
+
+    def test_defaults_to_the_current_working_directory(self) -> None:
+        base_path: str = mkdtemp(dir=self.root_directory.name)
 
-            setup_directory_structure(project_name)
+        with cd(base_path):
+            setup_directory_structure('OneTwo')
 
-            for directory in directories:
-                self.assertTrue(Path(directory).is_dir())
+        self.assertTrue(Path(base_path, 'OneTwo/application/core').is_dir())
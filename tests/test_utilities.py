@@ -1,14 +1,30 @@
 from os import getcwd
+from os.path import realpath
 from pathlib import Path
+from string import Template
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 
-from modules.utilities import cd, template_path
+from modules.utilities import cd, compile_template, copy_template, read_template, read_template_bytes, \
+    render_template, replace_line, template_path, tmpdir
 
 
 class CdTestCase(TestCase):
+    temporary_directory: TemporaryDirectory
+    destination: str
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.temporary_directory = TemporaryDirectory()
+        # getcwd() reports the resolved path, which differs from the temporary directory's when it is behind a symlink.
+        cls.destination = realpath(cls.temporary_directory.name)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.temporary_directory.cleanup()
+
     def setUp(self) -> None:
         self.old_cwd = getcwd()
-        self.destination = '/tmp'
 
         self.assertNotEqual(self.old_cwd, self.destination)
 
@@ -18,6 +34,14 @@ class CdTestCase(TestCase):
 
         self.assertEqual(getcwd(), self.old_cwd)
 
+    def test_yields_the_absolute_path_of_the_destination(self) -> None:
+        with cd(self.destination) as destination:
+            self.assertEqual(destination, Path(self.destination))
+
+        with cd(self.destination):
+            with cd('..') as destination:
+                self.assertEqual(destination.resolve(), Path(self.destination).parent)
+
     def test_changes_directory_context_back_when_exception_is_raised_within_with_context(self) -> None:
         try:
             with cd(self.destination):
@@ -26,7 +50,7 @@ class CdTestCase(TestCase):
             self.assertEqual(getcwd(), self.old_cwd)
 
     def test_does_not_change_directory_context_when_invalid_destination_is_passed(self) -> None:
-        non_existent_destination = '/NON/EXISTENT_DIRECTORY'
+        non_existent_destination = f'{self.destination}/NON/EXISTENT_DIRECTORY'
 
         try:
             with cd(non_existent_destination):
@@ -35,9 +59,133 @@ class CdTestCase(TestCase):
             self.assertEqual(getcwd(), self.old_cwd)
 
 
+class TmpdirTestCase(TestCase):
+    def test_yields_the_temporary_directory_and_removes_it_afterwards(self) -> None:
+        current_working_directory = getcwd()
+
+        with tmpdir() as temporary_directory:
+            self.assertTrue(temporary_directory.is_absolute())
+            self.assertTrue(temporary_directory.is_dir())
+            self.assertEqual(getcwd(), current_working_directory)
+
+        self.assertFalse(temporary_directory.exists())
+
+    def test_creates_the_temporary_directory_in_the_given_directory(self) -> None:
+        with tmpdir() as parent_directory:
+            with tmpdir(parent_directory) as temporary_directory:
+                self.assertEqual(temporary_directory.parent, parent_directory)
+
+
 class TemplatePathTestCase(TestCase):
     def test_points_to_the_templates_directory(self) -> None:
         self.assertEqual(
             template_path(''),
             Path(f'{Path(__file__).parent.parent}/templates')
         )
+
+    def test_returns_the_same_path_object_on_subsequent_calls(self) -> None:
+        self.assertIs(template_path('run'), template_path('run'))
+
+
+class ReadTemplateTestCase(TestCase):
+    def test_returns_the_contents_of_the_template(self) -> None:
+        self.assertEqual(read_template('run'), template_path('run').read_text(encoding='utf-8'))
+
+    def test_decodes_the_template_as_utf_8(self) -> None:
+        self.assertEqual(read_template('README.md'), template_path('README.md').read_bytes().decode('utf-8'))
+
+
+class ReadTemplateBytesTestCase(TestCase):
+    def test_returns_the_raw_contents_of_the_template(self) -> None:
+        self.assertEqual(read_template_bytes('README.md'), template_path('README.md').read_bytes())
+
+
+class CompileTemplateTestCase(TestCase):
+    def test_renders_the_same_as_string_templates(self) -> None:
+        substitutions = {
+            'PROJECT_NAME': 'OneTwo',
+            'PROJECT_DOMAIN': 'example.local',
+            'USER_ID': 1000,
+            'GROUP_ID': 1000,
+            'SSL_KEY_NAME': 'key.pem',
+            'SSL_CERTIFICATE_NAME': 'certificate.pem',
+            'POSTGRES_DB': 'onetwo',
+            'POSTGRES_USER': 'username',
+            'POSTGRES_PASSWORD': 'password',
+            'ADMINER_PORT': 8080,
+            'MAILHOG_PORT': 8025,
+            'NODE_IMAGE_TAG': 'stretch',
+        }
+
+        for template in [
+            'docker-compose.yml',
+            'run',
+            'README.md',
+            'configuration/nginx/conf.d/default.conf',
+            'configuration/nginx/conf.d/utils.conf',
+        ]:
+            self.assertEqual(
+                compile_template(template)(substitutions),
+                Template(read_template(template)).substitute(substitutions)
+            )
+
+    def test_raises_key_error_when_a_placeholder_value_is_missing(self) -> None:
+        with self.assertRaises(KeyError):
+            compile_template('run')({'PROJECT_NAME': 'OneTwo'})
+
+    def test_returns_the_same_renderer_on_subsequent_calls(self) -> None:
+        self.assertIs(compile_template('run'), compile_template('run'))
+
+
+class RenderTemplateTestCase(TestCase):
+    def test_writes_the_substituted_template_to_the_destination(self) -> None:
+        substitutions = {'PROJECT_NAME': 'OneTwo', 'NODE_IMAGE_TAG': 'stretch'}
+
+        with tmpdir() as temporary_directory:
+            render_template('run', temporary_directory / 'run', substitutions)
+
+            self.assertEqual(
+                (temporary_directory / 'run').read_text(),
+                Template(read_template('run')).substitute(substitutions)
+            )
+
+
+class CopyTemplateTestCase(TestCase):
+    def test_copies_the_template_to_the_destination(self) -> None:
+        with tmpdir() as temporary_directory:
+            copy_template('.gitignore', temporary_directory / '.gitignore')
+
+            self.assertEqual(
+                (temporary_directory / '.gitignore').read_bytes(),
+                template_path('.gitignore').read_bytes()
+            )
+
+
+class ReplaceLineTestCase(TestCase):
+    def test_replaces_the_matching_lines_whatever_their_indentation(self) -> None:
+        with tmpdir() as temporary_directory:
+            file = temporary_directory / 'file'
+            file.write_text('one\n    two\n\ttwo\nthree')
+
+            replace_line(file, 'two', '  four')
+
+            self.assertEqual(file.read_text(), 'one\n  four\n  four\nthree')
+
+    def test_keeps_the_ending_of_the_last_line(self) -> None:
+        with tmpdir() as temporary_directory:
+            file = temporary_directory / 'file'
+            file.write_text('one\ntwo')
+
+            replace_line(file, 'two', 'three')
+
+            self.assertEqual(file.read_text(), 'one\nthree')
+
+    def test_raises_runtime_error_when_no_line_matches(self) -> None:
+        with tmpdir() as temporary_directory:
+            file = temporary_directory / 'file'
+            file.write_text('one two\n')
+
+            with self.assertRaises(RuntimeError):
+                replace_line(file, 'two', 'three')
+
+            self.assertEqual(file.read_text(), 'one two\n')
@@ -1,156 +1,99 @@
-from re import compile
-from subprocess import run
 from typing import Tuple
 from unittest import TestCase
 
-from modules.verification import is_pascal_case, domain_is_valid, correct_version_is_installed
+from modules.verification import is_pascal_case, domain_is_valid, parse_version, version_satisfies
+
+PASCAL_CASE_STRINGS: Tuple[str, ...] = (
+    'One',
+    'OneTwo',
+    'OneTwoThree',
+)
+NON_PASCAL_CASE_STRINGS: Tuple[str, ...] = (
+    '',
+    ' ',
+    'one',
+    'onE',
+    'One Two',
+    'OneTwo3',
+    'oneTwo',
+    'One-Two',
+    'one-two',
+    'One_two',
+)
+
+VALID_DOMAINS: Tuple[str, ...] = (
+    'application.local',
+    'example.com',
+    'one-two.gg',
+    'api.application.org',
+    'onetwo33.com',
+    'example.com/',
+    'example.com/path?query=1',
+    'example.com?query=1',
+)
+INVALID_DOMAINS: Tuple[str, ...] = (
+    '://one.com',
+    'one**.com',
+    'example.com?',
+    'example.com/ path',
+    'example.com\n',
+)
 
 
 class PascalCaseTestCase(TestCase):
     def test_returns_true_for_correctly_pascal_cased_strings(self) -> None:
-        pascal_case_strings = [
-            'One',
-            'OneTwo',
-            'OneTwoThree',
-        ]
-
-        for pascal_case_string in pascal_case_strings:
-            self.assertTrue(is_pascal_case(pascal_case_string))
+        for pascal_case_string in PASCAL_CASE_STRINGS:
+            with self.subTest(string=pascal_case_string):
+                self.assertTrue(is_pascal_case(pascal_case_string))
 
     def test_returns_false_for_incorrectly_pascal_cased_strings(self) -> None:
-        non_pascal_cased_strings = [
-            '',
-            ' ',
-            'one',
-            'onE',
-            'One Two',
-            'OneTwo3',
-            'oneTwo',
-            'One-Two',
-            'one-two',
-            'One_two',
-        ]
-
-        for non_pascal_cased_string in non_pascal_cased_strings:
-            self.assertFalse(is_pascal_case(non_pascal_cased_string))
+        for non_pascal_cased_string in NON_PASCAL_CASE_STRINGS:
+            with self.subTest(string=non_pascal_cased_string):
+                self.assertFalse(is_pascal_case(non_pascal_cased_string))
 
 
 class DomainTestCase(TestCase):
     def test_returns_true_for_valid_domains(self) -> None:
-        valid_domains = [
-            'application.local',
-            'example.com',
-            'one-two.gg',
-            'api.application.org',
-            'onetwo33.com',
-        ]
-
-        for valid_domain in valid_domains:
-            self.assertTrue(domain_is_valid(valid_domain))
+        for valid_domain in VALID_DOMAINS:
+            with self.subTest(domain=valid_domain):
+                self.assertTrue(domain_is_valid(valid_domain))
 
     def test_returns_false_for_invalid_domains(self) -> None:
-        invalid_domains = [
-            '://one.com',
-            'one**.com',
-        ]
-
-        for invalid_domain in invalid_domains:
-            self.assertFalse(domain_is_valid(invalid_domain))
-
-
-class CorrectVersionIsInstalledTestCase(TestCase):
-    @staticmethod
-    def docker_version_command() -> Tuple[str, str, str, str]:
-        return 'docker', 'version', '--format', '{{.Server.Version}}'
-
-    @staticmethod
-    def docker_compose_version_command() -> Tuple[str, str, str]:
-        return 'docker-compose', 'version', '--short'
-
-    @staticmethod
-    def openssl_version_command() -> Tuple[str, str]:
-        return 'openssl', 'version'
-
-    @staticmethod
-    def git_version_command() -> Tuple[str, str]:
-        return 'git', 'version'
-
-    @staticmethod
-    def current_version(command: Tuple[str, ...]) -> str:
-        return run(command, capture_output=True, check=True).stdout.decode('utf-8').strip()
-
-    def test_returns_true_for_correct_docker_version(self) -> None:
-        self.assertTrue(
-            correct_version_is_installed(
-                self.docker_version_command(),
-                self.current_version(self.docker_version_command())
-            )
-        )
-
-    def test_returns_true_for_correct_docker_compose_version(self) -> None:
-        self.assertTrue(
-            correct_version_is_installed(
-                self.docker_compose_version_command(),
-                self.current_version(self.docker_compose_version_command())
-            )
-        )
-
-    def test_returns_true_for_correct_openssl_version(self) -> None:
-        self.assertTrue(
-            correct_version_is_installed(
-                self.openssl_version_command(),
-                self.current_version(self.openssl_version_command())
-            )
-        )
-
-    def test_returns_true_for_correct_git_version(self) -> None:
-        self.assertTrue(
-            correct_version_is_installed(
-                self.git_version_command(),
-                self.current_version(self.git_version_command())
-            )
-        )
-
-    def test_returns_false_for_smaller_docker_version(self) -> None:
-        self.assertFalse(
-            correct_version_is_installed(
-                self.docker_version_command(),
-                '.'.join(str(int(v) + 1) for v in self.current_version(self.docker_version_command()).split('.'))
-            )
-        )
-
-    def test_returns_false_for_smaller_docker_compose_version(self) -> None:
-        self.assertFalse(
-            correct_version_is_installed(
-                self.docker_compose_version_command(),
-                '.'.join(
-                    str(int(v) + 1) for v in self.current_version(self.docker_compose_version_command()).split('.')
-                )
-            )
-        )
-
-    def test_returns_false_for_smaller_openssl_version(self) -> None:
-        self.assertFalse(
-            correct_version_is_installed(
-                self.openssl_version_command(),
-                '.'.join(
-                    str(int(v) + 1) for v in
-                    compile(r'.*?(?P<version>\d+\.\d+\.\d+).*?').match(
-                        self.current_version(self.openssl_version_command())
-                    ).groupdict()['version'].split('.')
-                )
-            )
-        )
-
-    def test_returns_false_for_smaller_git_version(self) -> None:
-        self.assertFalse(
-            correct_version_is_installed(
-                self.git_version_command(),
-                '.'.join(
-                    str(int(v) + 1) for v in
-                    compile(r'.*?(?P<version>\d+\.\d+\.\d+).*?').match(
-                        self.current_version(self.git_version_command())
-                    ).groupdict()['version'].split('.')
-                )
-            )
-        )
+        for invalid_domain in INVALID_DOMAINS:
+            with self.subTest(domain=invalid_domain):
+                self.assertFalse(domain_is_valid(invalid_domain))
+
+
+class ParseVersionTestCase(TestCase):
+    def test_returns_the_first_version_in_the_text(self) -> None:
+        versions = {
+            '20.10.5': (20, 10, 5),
+            'git version 2.31.0': (2, 31, 0),
+            'Docker version 20.10.5, build 55c4c88': (20, 10, 5),
+            'OpenSSL 1.1.1k  25 Mar 2021': (1, 1, 1),
+            'v1..2.3.4': (2, 3, 4),
+            '1.2 3.4.5': (3, 4, 5),
+        }
+
+        for text, version in versions.items():
+            with self.subTest(text=text):
+                self.assertEqual(parse_version(text), version)
+
+    def test_parses_the_undecoded_output_of_a_program(self) -> None:
+        self.assertEqual(parse_version(b'git version 2.31.0\n'), (2, 31, 0))
+
+    def test_raises_value_error_when_the_text_does_not_contain_a_version(self) -> None:
+        for text in ['', 'git version', '1.2', '1..2.3']:
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    parse_version(text)
+
+
+class VersionSatisfiesTestCase(TestCase):
+    def test_returns_true_for_greater_or_equal_versions(self) -> None:
+        self.assertTrue(version_satisfies((2, 31, 0), '2.31.0'))
+        self.assertTrue(version_satisfies((2, 31, 0), '2.30.9'))
+
+    def test_returns_false_for_smaller_versions(self) -> None:
+        self.assertFalse(version_satisfies((2, 30, 9), '2.31.0'))
+        self.assertFalse(version_satisfies((1, 31, 0), '2.31.0'))